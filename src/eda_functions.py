@@ -9,20 +9,27 @@ The module is structured as follows:
 1. IMPORT LIBRARIES:
    - Data manipulation libraries (NumPy, Pandas)
    - Data visualization libraries (Matplotlib, Seaborn)
+   - Optional dataframe backend (Polars), imported only when requested
+   - Optional just-in-time compiler (Numba), imported only when a compiled function is first used
+   - Caching utilities (collections, functools, weakref)
 
 2. SET STANDARDIZED VARIABLES:
    - Standard color palette for plotting (Seaborn Set2)
+   - Kernels compiled with Numba on first use
+   - Registry of DataFrames and functions with cached aggregations
 
 3. FUNCTIONS:
    - feature_stats: Calculates counts and percentage distribution of unique values.
    - feature_filtered_stats: Filters DataFrame and calculates counts and percentages.
    - feature_grouped_stats: Calculates mean and standard deviation of features grouped by another feature.
    - get_total_revenue: Calculates total revenue based on order cost and take rate.
+   - get_total_revenue_vec: Vectorized version of get_total_revenue for a whole column of order costs.
    - metrics_to_dataframe: Converts metrics into a formatted DataFrame.
    - top_and_bottom_restaurants: Styles and displays top and bottom 5 restaurants based on a specified feature.
    - plot_count: Displays the distribution of a categorical feature in a horizontal count plot.
    - plot_histbox: Displays the distribution and outliers of a numerical feature using histogram and boxplot.
    - plot_boxplot_and_pointplot: Visualizes the relationship between a categorical feature and a numerical feature using boxplots and point plots.
+   - clear_eda_cache: Clears the cached aggregations used by the plotting and ranking functions.
 """
 
 # ---------------------------------------------------------
@@ -37,6 +44,11 @@ import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Import libraries for caching
+import weakref
+from collections import OrderedDict
+from functools import wraps
+
 
 # ---------------------------------------------------------
 # 2. SET STANDARDIZED VARIABLES
@@ -45,14 +57,505 @@ import seaborn as sns
 # Set standard color palette for plotting
 palette_color = sns.color_palette("Set2")
 
+# Optional just-in-time compiler (Numba), imported on first use of a kernel
+numba = None
+
+# Kernels compiled with Numba by function, None if Numba is not installed
+_numba_kernels = {}
+
+# Registry of DataFrames by id, used to drop their cached aggregations once collected
+_df_registry = weakref.WeakValueDictionary()
+
+# Registry of functions with cached aggregations
+_frame_caches = []
+
 
 # ---------------------------------------------------------
 # 3. FUNCTIONS
 # ---------------------------------------------------------
 
 
+# Function to compile a kernel with Numba on first use
+def _numba_kernel(func, **options):
+    """
+    Get the Numba-compiled version of a function. Numba is imported on the
+    first call rather than with this module, which keeps the module import
+    fast when no compiled function is used.
+
+    Parameters:
+    - func (callable): The function to compile.
+    - **options: Keyword arguments passed to numba.njit.
+
+    Returns:
+    - callable or None: The compiled function, or None if Numba is not installed.
+    """
+    global numba
+
+    if func not in _numba_kernels:
+        try:
+            import numba
+        except ImportError:
+            _numba_kernels[func] = None
+        else:
+            _numba_kernels[func] = numba.njit(**options)(func)
+
+    return _numba_kernels[func]
+
+
+# Function to validate the dataframe backend used for the computation
+def _check_backend(backend):
+    """
+    Raise a ValueError if the backend is not supported.
+
+    Parameters:
+    - backend (str): The dataframe library, "pandas" or "polars".
+    """
+    if backend not in ("pandas", "polars"):
+        raise ValueError(f"backend must be 'pandas' or 'polars', got: {backend!r}")
+
+
+# Function to encode a column as integer codes for Polars
+def _polars_codes(series, sort=False):
+    """
+    Encode a column as integer codes and the unique values they refer to, so
+    Polars only receives plain NumPy arrays (no pyarrow needed for categorical,
+    nullable or string columns).
+
+    Parameters:
+    - series (pd.Series): The column to encode.
+    - sort (bool): Whether the codes follow the sorted unique values. Default is False.
+
+    Returns:
+    - tuple: The codes as a NumPy array (-1 for missing values) and the unique values.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Keep every category, including the unused ones
+        categories = np.arange(len(series.cat.categories))
+        return series.cat.codes.to_numpy(), pd.Categorical.from_codes(
+            categories, dtype=series.dtype
+        )
+
+    return pd.factorize(series, sort=sort)
+
+
+# Function to count the unique values of a feature with Polars
+def _polars_value_counts(
+    data, feature, filter_column=None, filter_value=None, ascending=False
+):
+    """
+    Count the unique values of a feature with Polars, optionally restricted to
+    the rows where filter_column equals filter_value.
+
+    Parameters:
+    - data (pd.DataFrame): The input DataFrame.
+    - feature (str): The column whose unique values are counted.
+    - filter_column (str, optional): The column to filter by.
+    - filter_value (str, optional): The value to filter on.
+    - ascending (bool): Sort order for the counts. Default is False (descending).
+
+    Returns:
+    - pd.Series: The counts indexed by the unique values, as from Series.value_counts.
+    """
+    import polars as pl
+
+    codes, uniques = _polars_codes(data[feature])
+    frame = pl.DataFrame({"code": codes})
+    if filter_column is not None:
+        mask = data[filter_column].eq(filter_value).to_numpy(dtype=bool, na_value=False)
+        frame = frame.filter(pl.Series(mask, dtype=pl.Boolean))
+
+    counts = (
+        frame.filter(pl.col("code") >= 0)
+        .group_by("code", maintain_order=True)
+        .len()
+        .sort("len", descending=not ascending, maintain_order=True)
+    )
+    code_values = counts["code"].to_numpy()
+    count_values = counts["len"].to_numpy().astype(np.int64)
+
+    # Report unused categories with a count of 0, as Series.value_counts does
+    if isinstance(uniques, pd.Categorical):
+        unused = np.setdiff1d(np.arange(len(uniques)), code_values)
+        zeros = np.zeros(len(unused), dtype=np.int64)
+        if ascending:
+            code_values = np.concatenate([unused, code_values])
+            count_values = np.concatenate([zeros, count_values])
+        else:
+            code_values = np.concatenate([code_values, unused])
+            count_values = np.concatenate([count_values, zeros])
+
+    return pd.Series(
+        count_values,
+        index=pd.Index(uniques.take(code_values), name=feature),
+        name="count",
+    )
+
+
+# Function to calculate the grouped mean and standard deviation with Polars
+def _polars_grouped_stats(data, gbfeatures, features):
+    """
+    Calculate the mean and standard deviation of features grouped by other
+    features with Polars, shaped like the pandas groupby aggregation.
+
+    Parameters:
+    - data (pd.DataFrame): The input DataFrame.
+    - gbfeatures (str or list): The feature(s) to group by.
+    - features (str or list): The feature(s) to aggregate.
+
+    Returns:
+    - pd.DataFrame: The grouped means and standard deviations, indexed by the group keys.
+    """
+    import polars as pl
+
+    keys = [gbfeatures] if isinstance(gbfeatures, str) else list(gbfeatures)
+    selected = [features] if isinstance(features, str) else list(features)
+
+    # Group on integer codes and aggregate float columns, missing values as null
+    encoded = {key: _polars_codes(data[key], sort=True) for key in keys}
+    columns = {key: codes for key, (codes, _) in encoded.items()}
+    for f in selected:
+        if f not in columns:
+            columns[f] = pl.Series(
+                f, data[f].to_numpy(dtype=np.float64, na_value=np.nan), nan_to_null=True
+            )
+
+    frame = pl.DataFrame(columns)
+    aggregated = (
+        frame.filter(pl.all_horizontal([pl.col(key) >= 0 for key in keys]))
+        .group_by(keys)
+        .agg(
+            [pl.col(f).mean().alias(f"{f}_mean") for f in selected]
+            + [pl.col(f).std().alias(f"{f}_std") for f in selected]
+        )
+        .sort(keys)
+    )
+
+    index = pd.MultiIndex.from_arrays(
+        [encoded[key][1].take(aggregated[key].to_numpy()) for key in keys], names=keys
+    )
+    if len(keys) == 1:
+        index = index.get_level_values(0)
+
+    fstats = pd.DataFrame(
+        {
+            (f, stat): aggregated[f"{f}_{stat}"].to_numpy()
+            for f in selected
+            for stat in ("mean", "std")
+        },
+        index=index,
+    )
+
+    # Add the unused categories back as empty groups, as the pandas groupby
+    # does for categorical keys
+    if any(isinstance(uniques, pd.Categorical) for _, uniques in encoded.values()):
+        index = pd.MultiIndex.from_product(
+            [uniques for _, uniques in encoded.values()], names=keys
+        )
+        if len(keys) == 1:
+            index = index.get_level_values(0)
+        fstats = fstats.reindex(index)
+
+    if isinstance(features, str):
+        fstats.columns = fstats.columns.droplevel(0)
+
+    return fstats
+
+
+# Function to calculate the grouped mean and variance in a single pass (compiled with Numba)
+def _welford_pass(codes, values, n_groups):
+    """
+    Calculate the mean and sample variance of values per group code with
+    Welford's one-pass algorithm, skipping negative codes and NaN values.
+
+    Parameters:
+    - codes (np.ndarray): Group code of each value, -1 for missing keys.
+    - values (np.ndarray): The float values to aggregate.
+    - n_groups (int): The number of groups.
+
+    Returns:
+    - tuple: Arrays of the means and variances per group, NaN where undefined.
+    """
+    count = np.zeros(n_groups, dtype=np.int64)
+    mean = np.zeros(n_groups)
+    m2 = np.zeros(n_groups)
+
+    for i in range(codes.size):
+        g = codes[i]
+        x = values[i]
+        if g < 0 or np.isnan(x):
+            continue
+        count[g] += 1
+        delta = x - mean[g]
+        mean[g] += delta / count[g]
+        m2[g] += delta * (x - mean[g])
+
+    means = np.full(n_groups, np.nan)
+    variances = np.full(n_groups, np.nan)
+    for g in range(n_groups):
+        if count[g] > 0:
+            means[g] = mean[g]
+        if count[g] > 1:
+            variances[g] = m2[g] / (count[g] - 1)
+
+    return means, variances
+
+
+# Function to calculate the grouped mean and standard deviation with the compiled Welford pass
+def _welford_grouped_stats(data, gbfeature, features, welford):
+    """
+    Calculate the mean and standard deviation of features grouped by a single
+    feature, reading each feature column once, shaped like the pandas groupby
+    aggregation.
+
+    Parameters:
+    - data (pd.DataFrame): The input DataFrame.
+    - gbfeature (str): The feature to group by.
+    - features (str or list): The feature(s) to aggregate.
+    - welford (callable): The compiled _welford_pass.
+
+    Returns:
+    - pd.DataFrame: The grouped means and standard deviations, indexed by the group keys.
+    """
+    selected = [features] if isinstance(features, str) else list(features)
+
+    codes, uniques = pd.factorize(data[gbfeature], sort=True)
+
+    fstats = {}
+    for f in selected:
+        values = data[f].to_numpy(dtype=np.float64, na_value=np.nan)
+        means, variances = welford(codes, values, len(uniques))
+        fstats[(f, "mean")] = means
+        fstats[(f, "std")] = np.sqrt(variances)
+
+    fstats = pd.DataFrame(fstats, index=pd.Index(uniques, name=gbfeature))
+    if isinstance(features, str):
+        fstats.columns = fstats.columns.droplevel(0)
+
+    return fstats
+
+
+# Function to register a DataFrame for the cached aggregations
+def _register(data):
+    """
+    Register a DataFrame for the cached aggregations and return its cache key.
+    The cached aggregations of a DataFrame are dropped once it is garbage
+    collected, so a recycled id never returns results of a previous DataFrame.
+
+    Parameters:
+    - data (pd.DataFrame): The input DataFrame.
+
+    Returns:
+    - int: The id of the DataFrame, used as cache key.
+    """
+    df_id = id(data)
+    if _df_registry.get(df_id) is not data:
+        _df_registry[df_id] = data
+        weakref.finalize(data, _discard_cached, df_id)
+
+    return df_id
+
+
+# Function to drop the cached aggregations of a single DataFrame
+def _discard_cached(df_id):
+    """
+    Drop the cached aggregations of the DataFrame with the given id.
+
+    Parameters:
+    - df_id (int): The cache key returned by _register.
+    """
+    for cached in _frame_caches:
+        cached.cache_discard(df_id)
+
+
+# Function to get weak references to the arrays backing columns of a DataFrame
+def _column_refs(data, columns):
+    """
+    Get weak references to the arrays backing the given columns. Reassigning a
+    column replaces its backing array, so comparing the references detects
+    stale cache entries.
+
+    Parameters:
+    - data (pd.DataFrame): The input DataFrame.
+    - columns (list): The column names.
+
+    Returns:
+    - list or None: The weak references, or None if an array does not support them.
+    """
+    refs = []
+    for column in columns:
+        values = data[column].array
+        if isinstance(values, pd.arrays.NumpyExtensionArray):
+            values = values.to_numpy()
+            while isinstance(values.base, np.ndarray):
+                values = values.base
+        try:
+            refs.append(weakref.ref(values))
+        except TypeError:
+            return None
+
+    return refs
+
+
+# Function to cache an aggregation per DataFrame, arguments and backing columns
+def _frame_cache(maxsize, columns):
+    """
+    Decorate a function of (data, *args) so that, when called with cache=True,
+    its results are cached per DataFrame and arguments, and recomputed when one
+    of the columns it reads has been reassigned since. Values overwritten in
+    place are not detected, so caching is opt-in.
+
+    Parameters:
+    - maxsize (int): The maximum number of cached results, least recently used first out.
+    - columns (callable): Returns the column names read by the function, given *args.
+
+    Returns:
+    - callable: The decorator.
+    """
+
+    def decorator(func):
+        entries = OrderedDict()
+
+        @wraps(func)
+        def wrapper(data, *args, cache=False):
+            if not cache:
+                return func(data, *args)
+
+            key = (_register(data),) + args
+            refs = _column_refs(data, columns(*args))
+            if refs is None:
+                return func(data, *args)
+
+            entry = entries.get(key)
+            if entry is not None and all(
+                old() is new() for old, new in zip(entry[0], refs)
+            ):
+                entries.move_to_end(key)
+                return entry[1]
+
+            result = func(data, *args)
+            entries[key] = (refs, result)
+            entries.move_to_end(key)
+            if len(entries) > maxsize:
+                entries.popitem(last=False)
+
+            return result
+
+        def cache_discard(df_id):
+            for key in [key for key in entries if key[0] == df_id]:
+                del entries[key]
+
+        wrapper.cache_clear = entries.clear
+        wrapper.cache_discard = cache_discard
+        _frame_caches.append(wrapper)
+
+        return wrapper
+
+    return decorator
+
+
+# Function to cache the counts of unique values of a feature
+@_frame_cache(maxsize=128, columns=lambda feature: [feature])
+def _cached_value_counts(data, feature):
+    """
+    Count the unique values of a feature.
+
+    Parameters:
+    - data (pd.DataFrame): The input DataFrame.
+    - feature (str): The column whose unique values are counted.
+
+    Returns:
+    - pd.Series: The counts sorted in descending order.
+    """
+    return data[feature].value_counts()
+
+
+# Function to cache the float values of a numerical feature
+# (few entries, as each holds a full column)
+@_frame_cache(maxsize=8, columns=lambda feature: [feature])
+def _cached_values(data, feature):
+    """
+    Materialize a numerical feature once as a contiguous, read-only float
+    array shared by statistics and plots.
+
+    Parameters:
+    - data (pd.DataFrame): The input DataFrame.
+    - feature (str): The numerical column to materialize.
+
+    Returns:
+    - np.ndarray: The values as float64 array, with NaN for missing values.
+    """
+    arr = data[feature].to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+    arr.flags.writeable = False
+
+    return arr
+
+
+# Function to cache the average of a feature per restaurant
+@_frame_cache(
+    maxsize=128,
+    columns=lambda filter_feature, delivery_threshold: [
+        "restaurant_name",
+        filter_feature,
+    ],
+)
+def _cached_restaurant_means(data, filter_feature, delivery_threshold):
+    """
+    Calculate the average of a feature per restaurant, for restaurants with
+    more than delivery_threshold deliveries.
+
+    Parameters:
+    - data (pd.DataFrame): The input DataFrame.
+    - filter_feature (str): The feature to calculate the average for.
+    - delivery_threshold (int): The minimum number of deliveries required to be included.
+
+    Returns:
+    - pd.Series: The averages indexed by restaurant name.
+    """
+    # Encode restaurant names as integer codes (-1 for missing names), with the
+    # names sorted so that ties keep alphabetical order
+    codes, restaurants = pd.factorize(data["restaurant_name"], sort=True)
+    values = data[filter_feature].to_numpy(dtype=np.float64, na_value=np.nan)
+    n_restaurants = len(restaurants)
+
+    # Count the deliveries per restaurant
+    named = codes >= 0
+    deliveries = np.bincount(codes[named], minlength=n_restaurants)
+
+    # Sum and count the non-missing values per restaurant
+    present = named & ~np.isnan(values)
+    sums = np.bincount(codes[present], weights=values[present], minlength=n_restaurants)
+    counts = np.bincount(codes[present], minlength=n_restaurants)
+
+    # Keep restaurants with more than the specified number of deliveries and
+    # calculate their averages (NaN if the feature is missing for all orders)
+    keep = deliveries > delivery_threshold
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = sums[keep] / counts[keep]
+
+    return pd.Series(
+        means,
+        index=pd.Index(restaurants[keep], name="restaurant_name"),
+        name=filter_feature,
+    )
+
+
+# Function to clear the cached aggregations
+def clear_eda_cache():
+    """
+    Clear the cached aggregations used by top_and_bottom_restaurants, plot_count
+    and plot_histbox with cache=True. Reassigned columns are detected
+    automatically; call this after overwriting values of an existing column in
+    place (e.g. with .loc).
+
+    Returns:
+    - None
+    """
+    for cached in _frame_caches:
+        cached.cache_clear()
+
+
 # Function to calculate the counts and percentage distribution of unique values for any categorical feature
-def feature_stats(data, feature, n=None):
+def feature_stats(data, feature, n=None, backend="pandas"):
     """
     Calculate the counts and percentage distribution of unique values in a specified feature.
 
@@ -60,18 +563,41 @@ def feature_stats(data, feature, n=None):
     - data (DataFrame): The input DataFrame.
     - feature (str): The column name for which the statistics are calculated.
     - n (int, optional): The number of top results to return. If None, return all results.
+    - backend (str, optional): The library used for counting, "pandas" or "polars" (requires Polars). Default is "pandas".
 
     Returns:
     - DataFrame: A DataFrame containing the counts and percentages of unique values.
     """
-    counts = data[feature].value_counts()
-    percentages = data[feature].value_counts(normalize=True).mul(100).round(2)
+    _check_backend(backend)
+
+    # Count once and derive the percentages from the counts
+    if backend == "polars":
+        counts = _polars_value_counts(data, feature)
+    else:
+        series = data[feature]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Count the category codes directly, skipping missing values (-1)
+            codes = series.cat.codes.to_numpy()
+            bincounts = np.bincount(
+                codes[codes >= 0], minlength=len(series.cat.categories)
+            )
+            order = np.argsort(-bincounts, kind="stable")
+            counts = pd.Series(
+                bincounts[order],
+                index=pd.CategoricalIndex(
+                    pd.Categorical.from_codes(order, dtype=series.dtype), name=feature
+                ),
+                name="count",
+            )
+        else:
+            counts = series.value_counts()
+    percentages = counts.mul(100.0 / max(counts.sum(), 1)).round(2)
 
     fstats_df = pd.DataFrame(
         {
             feature: counts.index,
-            "count": counts.values,
-            "percentage": percentages.values,
+            "count": counts.to_numpy(),
+            "percentage": percentages.to_numpy(),
         }
     ).reset_index(drop=True)
 
@@ -80,7 +606,7 @@ def feature_stats(data, feature, n=None):
 
 # Function to filter DataFrame and calculate the counts and percentage distribution of unique values for any categorical feature
 def feature_filtered_stats(
-    data, feature, filter_column, filter_value, ascending_sort=False
+    data, feature, filter_column, filter_value, ascending_sort=False, backend="pandas"
 ):
     """
     Filter DataFrame and compute the counts and percentage distribution of unique values in a specified feature.
@@ -91,15 +617,26 @@ def feature_filtered_stats(
     filter_column (str): The column to filter by.
     filter_value (str): The value to filter on.
     ascending_sort (bool): Sort order for the counts. Default is False (descending).
+    backend (str): The library used for filtering and counting, "pandas" or "polars" (requires Polars). Default is "pandas".
 
     Returns:
     pd.DataFrame: A DataFrame with counts and percentages of the specified feature.
     """
-    # Filter data by the specified column and value
-    filtered_df = data[data[filter_column] == filter_value]
+    _check_backend(backend)
 
-    # Compute counts
-    counts = filtered_df[feature].value_counts(ascending=ascending_sort)
+    if backend == "polars":
+        # Filter and compute counts in Polars
+        counts = _polars_value_counts(
+            data, feature, filter_column, filter_value, ascending=ascending_sort
+        )
+    else:
+        # Filter the feature by the specified column and value with a NumPy
+        # boolean mask, without copying the other columns
+        mask = data[filter_column].eq(filter_value).to_numpy(dtype=bool, na_value=False)
+        filtered = pd.Series(data[feature].array[mask], name=feature)
+
+        # Compute counts
+        counts = filtered.value_counts(ascending=ascending_sort)
 
     # Compute percentages
     total_counts = counts.sum()
@@ -117,7 +654,7 @@ def feature_filtered_stats(
 
 
 # Function to calculate and display the mean values of a feature grouped by another feature
-def feature_grouped_stats(data, gbfeatures, features):
+def feature_grouped_stats(data, gbfeatures, features, backend="pandas"):
     """
     Calculate and display the mean and standard deviation of specified features
     grouped by another feature.
@@ -126,13 +663,43 @@ def feature_grouped_stats(data, gbfeatures, features):
     - data (pd.DataFrame): The input DataFrame containing the data.
     - gbfeatures (str or list): The feature(s) to group by.
     - features (str or list): The feature(s) for which to calculate the mean and standard deviation.
+    - backend (str, optional): The library used for grouping, "pandas" or "polars" (requires Polars). Default is "pandas".
 
     Returns:
     - pd.DataFrame: A DataFrame with the grouped means and standard deviations, rounded to 2 decimal places.
     """
-    filtered_df = data.groupby(gbfeatures)[features]
+    _check_backend(backend)
+
+    # The compiled and Polars aggregations read the features as float arrays,
+    # other dtypes (e.g. datetime or timedelta) are aggregated by pandas
+    selected = [features] if isinstance(features, str) else list(features)
+    numeric = all(pd.api.types.is_numeric_dtype(data[feature]) for feature in selected)
+
+    # Use the compiled one-pass aggregation for a single, non-categorical key
+    # if Numba is installed
+    welford = None
+    if (
+        backend == "pandas"
+        and numeric
+        and isinstance(gbfeatures, str)
+        and not isinstance(data[gbfeatures].dtype, pd.CategoricalDtype)
+    ):
+        welford = _numba_kernel(_welford_pass, cache=True)
+
+    if backend == "polars":
+        if not numeric:
+            raise TypeError("The polars backend only aggregates numerical features")
+        fstats = _polars_grouped_stats(data, gbfeatures, features)
+    elif welford is not None:
+        # Aggregate mean and standard deviation in one pass per feature
+        fstats = _welford_grouped_stats(data, gbfeatures, features, welford)
+    else:
+        # Aggregate mean and standard deviation in one call
+        fstats = data.groupby(gbfeatures)[features].agg(["mean", "std"])
+
+    # Round the small aggregated result
+    fstats = fstats.round(2)
 
-    fstats = filtered_df.agg(["mean", "std"]).round(2)
     return fstats.reset_index()
 
 
@@ -157,6 +724,64 @@ def get_total_revenue(x, uL, lL):
         return 0
 
 
+# Function to calculate total revenue in a single parallel loop (compiled with Numba)
+def _revenue_loop(c, uL, lL, out):
+    """
+    Write the total revenue of each order cost in c into out, in parallel.
+
+    Parameters:
+    c (np.ndarray): One-dimensional array of order costs.
+    uL (float): Percentage for orders above $20.
+    lL (float): Percentage for orders between $5 and $20.
+    out (np.ndarray): Output array of the same shape as c.
+
+    Returns:
+    np.ndarray: The output array.
+    """
+    for i in numba.prange(c.size):
+        x = c[i]
+        if x > 20:
+            out[i] = x * uL
+        elif x > 5:
+            out[i] = x * lL
+        else:
+            out[i] = 0.0
+    return out
+
+
+# Function to calculate total revenue for a whole column of order costs
+def get_total_revenue_vec(cost, uL, lL):
+    """
+    Calculate total revenue for an array of order costs based on take rate.
+    Vectorized equivalent of get_total_revenue.
+
+    Parameters:
+    cost (array-like): Costs of the orders.
+    uL (float): Percentage for orders above $20.
+    lL (float): Percentage for orders between $5 and $20.
+
+    Returns:
+    np.ndarray: Calculated total revenue for each order.
+    """
+    c = np.asarray(cost, dtype=np.float64)
+
+    # Use the compiled loop if Numba is installed, which writes the output
+    # without the temporary arrays of the NumPy version
+    revenue = _numba_kernel(_revenue_loop, parallel=True, cache=True)
+    if revenue is not None:
+        out = np.empty(c.shape)
+        revenue(c.ravel(), uL, lL, out.reshape(-1))
+        return out
+
+    # Otherwise select the take rate with boolean masks used as multipliers,
+    # leaving orders without a take rate (including missing costs) at 0
+    hi = c > 20
+    mid = (c > 5) & ~hi
+    rate = uL * hi + lL * mid
+
+    return np.multiply(c, rate, out=np.zeros_like(c), where=rate != 0)
+
+
 # Function to convert metrics into a DataFrame
 def metrics_to_dataframe(**kwargs):
     """
@@ -169,15 +794,10 @@ def metrics_to_dataframe(**kwargs):
     Returns:
         pd.DataFrame: A DataFrame containing the metric names, their formatted values, and unit symbols.
     """
-    # Create lists for metrics, values, and units
-    metrics = []
-    values = []
-    units = []
-
-    for metric, (value, symbol) in kwargs.items():
-        metrics.append(metric)
-        values.append(round(value, 2))
-        units.append(symbol)
+    # Create metrics, values, and units
+    metrics = list(kwargs)
+    values = [round(value, 2) for value, _ in kwargs.values()]
+    units = [symbol for _, symbol in kwargs.values()]
 
     # Create DataFrame
     dataframe = pd.DataFrame(
@@ -192,7 +812,9 @@ def metrics_to_dataframe(**kwargs):
 
 
 # Function to calculate and style the top and bottom 5 restaurants based on a specified feature
-def top_and_bottom_restaurants(data, filter_feature, delivery_threshold=10):
+def top_and_bottom_restaurants(
+    data, filter_feature, delivery_threshold=10, cache=False
+):
     """
     Generate a styled DataFrame showing the top 5 and bottom 5 restaurants
     based on the average of a specified feature, filtered by a minimum
@@ -202,58 +824,69 @@ def top_and_bottom_restaurants(data, filter_feature, delivery_threshold=10):
     data (pd.DataFrame): The DataFrame containing restaurant data.
     filter_feature (str): The feature to calculate the average for (e.g., 'order_completion_time').
     delivery_threshold (int): The minimum number of deliveries required to be included (default is 10).
+    cache (bool): Whether to reuse the averages cached for this DataFrame, only while its values are not modified in place (default is False).
 
     Returns:
     styled_df (pd.io.formats.style.Styler): A styled DataFrame with top 5 and bottom 5 restaurants.
     """
-    # Filter restaurants with more than the specified number of deliveries
-    filtered_df = data.groupby("restaurant_name").filter(
-        lambda x: len(x) > delivery_threshold
+    # Calculate the average order completion time of restaurants with more than
+    # the specified number of deliveries (cached per DataFrame and feature on request)
+    average_time = _cached_restaurant_means(
+        data, filter_feature, delivery_threshold, cache=cache
     )
+    means = average_time.to_numpy(dtype=np.float64, na_value=np.nan)
+    names = average_time.index.to_numpy()
+
+    # Get the positions of the top 5 and last 5 restaurants, partitioning
+    # instead of sorting all restaurants when there are more than 10. All
+    # restaurants tied with the 5th value are kept as candidates and sorted
+    # stably, so ties keep alphabetical order as in a full stable sort
+    # (missing averages compare as largest, as np.sort places them last)
+    n, k = len(means), 5
+    if n > 2 * k:
+        kth = np.partition(means, k - 1)[k - 1]
+        candidates = np.flatnonzero(~(means > kth))
+        top_5 = candidates[np.argsort(means[candidates], kind="stable")][:k]
+        kth = np.partition(means, n - k)[n - k]
+        candidates = np.flatnonzero(~(means < kth))
+        last_5 = candidates[np.argsort(means[candidates], kind="stable")][-k:]
+    else:
+        order = np.argsort(means, kind="stable")
+        top_5, last_5 = order[:k], order[-k:]
+    ranks = np.arange(n)
 
-    # Calculate the average order completion time
-    average_time = (
-        filtered_df.groupby("restaurant_name")[filter_feature]
-        .mean()
-        .sort_values()
-        .round(2)
-        .reset_index()
-    )
-
-    # Get the top 5 and last 5 restaurants
-    top_5 = average_time.head(5)
-    last_5 = average_time.tail(5)
-
-    # Concatenate the top 5 and last 5 DataFrames
-    average_time_df = pd.concat([top_5, last_5])
-
-    # Rename columns
-    average_time_df.rename(
-        columns={filter_feature: f"average_{filter_feature}"}, inplace=True
+    # Concatenate the top 5 and last 5 restaurants, indexed by their rank
+    positions = np.concatenate([top_5, last_5])
+    average_time_df = pd.DataFrame(
+        {
+            "restaurant_name": names[positions],
+            f"average_{filter_feature}": means[positions].round(2),
+        },
+        index=np.concatenate([ranks[:k], ranks[-k:]]),
     )
 
-    # Function to add a border to the bottom edge of the 5th row
-    def add_upper_border(row):
-        return (
-            ["border-bottom: 0.5px solid grey"] * len(row)
-            if row.name == 4
-            else [""] * len(row)
-        )
-
-    # Function to add a border to the bottom edge of the 5th row (index)
-    def add_upper_border_index(val):
-        return "border-bottom: 0.5px solid grey" if val == 4 else ""
-
     # Apply styles to the DataFrame
-    styled_df = average_time_df.style.apply(add_upper_border, axis=1)
-    styled_df = styled_df.applymap_index(add_upper_border_index, axis=0)
-    styled_df = styled_df.format({f"average_{filter_feature}": "{:.2f}"})
+    styled_df = average_time_df.style.format({f"average_{filter_feature}": "{:.2f}"})
+
+    # Add a border to the bottom edge of the 5th row (cells and index) with a
+    # single CSS rule, if the top 5 are complete
+    if n >= k:
+        styled_df = styled_df.set_table_styles(
+            [
+                {
+                    "selector": "tbody tr:nth-child(5) td, tbody tr:nth-child(5) th",
+                    "props": "border-bottom: 0.5px solid grey",
+                }
+            ]
+        )
 
     return styled_df
 
 
 # Function to display the distribution of a categorical feature
-def plot_count(data, feature, figsize=(14, 8)):
+def plot_count(
+    data, feature, figsize=(14, 8), show=True, return_fig=False, cache=False
+):
     """
     Display the distribution of a categorical feature in a horizontal count plot.
 
@@ -261,23 +894,26 @@ def plot_count(data, feature, figsize=(14, 8)):
     - data (DataFrame): The input DataFrame.
     - feature (str): The column name for which the distribution is plotted.
     - figsize (tuple, optional): The size of the figure. Default is (12, 7).
+    - show (bool, optional): Whether to display the figure. Default is True.
+    - return_fig (bool, optional): Whether to return the figure. Default is False.
+    - cache (bool, optional): Whether to reuse the counts cached for this DataFrame, only while its values are not modified in place. Default is False.
 
     Returns:
-    - None: The function displays the plot.
+    - Figure or None: The figure if return_fig is True, otherwise None. The function displays the plot if show is True.
     """
-    # Sort the order
-    sorted_count = data[feature].value_counts().sort_values(ascending=False)
+    # Sort the order (value_counts already sorts by descending count)
+    sorted_idx = _cached_value_counts(data, feature, cache=cache).index.tolist()
 
     # Initiate figure
-    plt.figure(figsize=figsize)
+    fig = plt.figure(figsize=figsize, layout="constrained")
 
     # Plot countplot
     sns.countplot(
         data=data,
         y=feature,
         hue=feature,
-        order=sorted_count.index,
-        hue_order=sorted_count.index,
+        order=sorted_idx,
+        hue_order=sorted_idx,
         palette=palette_color,
     )
 
@@ -286,12 +922,27 @@ def plot_count(data, feature, figsize=(14, 8)):
     plt.title(f"Distribution of {formatted_title}s")
     plt.grid(axis="x", linestyle="--", linewidth=0.5)
 
-    plt.tight_layout(pad=2.0)
-    plt.show()
+    # Display the figure, or close it if it is neither displayed nor returned
+    if show:
+        plt.show()
+    elif not return_fig:
+        plt.close(fig)
+
+    if return_fig:
+        return fig
 
 
 # Function to display the distribution, potential outliers and statistical summary of a numerical feature
-def plot_histbox(data, feature, figsize=(14, 8)):
+def plot_histbox(
+    data,
+    feature,
+    figsize=(14, 8),
+    kde=False,
+    bins="auto",
+    show=True,
+    return_fig=False,
+    cache=False,
+):
     """
     Display the distribution and outliers of a numerical feature using a histogram and boxplot.
 
@@ -299,33 +950,54 @@ def plot_histbox(data, feature, figsize=(14, 8)):
     - data (DataFrame): The input DataFrame.
     - feature (str): The column name for which the distribution and outliers are plotted.
     - figsize (tuple, optional): The size of the figure. Default is (12, 7).
+    - kde (bool, optional): Whether to overlay a kernel density estimate on the histogram. Default is False.
+    - bins (str or int, optional): The binning rule or number of bins for the histogram. Default is "auto", as in seaborn.
+    - show (bool, optional): Whether to display the figure. Default is True.
+    - return_fig (bool, optional): Whether to return the figure. Default is False.
+    - cache (bool, optional): Whether to reuse the values cached for this DataFrame, only while its values are not modified in place. Default is False.
 
     Returns:
-    - None: The function displays the plots and prints key statistics.
+    - Figure or None: The figure if return_fig is True, otherwise None. The function displays the plots if show is True and prints key statistics.
     """
+    # Materialize the feature once and share it between statistics and plots
+    # (cached per DataFrame and feature on request)
+    arr = _cached_values(data, feature, cache=cache)
+    values = pd.Series(arr, name=feature, copy=False)
+
     # Obtain summary statistic of feature
-    fstats = data[feature].describe().T
-    fstats = fstats.loc[["mean", "50%", "std", "min", "max"]].to_dict()
-    fstats["median"] = fstats.pop("50%")  # Rename the '50%' key to 'median'
+    fstats = {
+        "mean": np.nanmean(arr),
+        "std": np.nanstd(arr, ddof=1),
+        "min": np.nanmin(arr),
+        "max": np.nanmax(arr),
+        "median": np.nanmedian(arr),
+    }
+
+    # Compute the histogram bin edges once from the non-missing values
+    edges = np.histogram_bin_edges(arr[~np.isnan(arr)], bins=bins)
 
     # Initiate figure
     fig, (ax1, ax2) = plt.subplots(
-        2, 1, sharex=True, figsize=figsize, gridspec_kw={"height_ratios": [2, 1]}
+        2,
+        1,
+        sharex=True,
+        figsize=figsize,
+        gridspec_kw={"height_ratios": [2, 1]},
+        layout="constrained",
     )
 
     # Plot histogram and boxplot
     sns.histplot(
-        data,
-        x=feature,
-        kde=True,
+        x=values,
+        bins=edges,
+        kde=kde,
         color=palette_color[0],
         edgecolor="darkgreen",
         linewidth=1.0,
         ax=ax1,
     )
     sns.boxplot(
-        data,
-        x=feature,
+        x=values,
         color=palette_color[1],
         medianprops=dict(visible=True, color="black"),
         flierprops=dict(marker="o", markersize=3),
@@ -354,8 +1026,11 @@ def plot_histbox(data, feature, figsize=(14, 8)):
     ax1.set_title(f"Distribution of {formatted_title}s")
     ax1.set_ylabel("count")
 
-    plt.tight_layout(pad=2.0)
-    plt.show()
+    # Display the figure, or close it if it is neither displayed nor returned
+    if show:
+        plt.show()
+    elif not return_fig:
+        plt.close(fig)
 
     # Print the key statistics
     formatted_stats = ", ".join(
@@ -363,9 +1038,14 @@ def plot_histbox(data, feature, figsize=(14, 8)):
     )
     print(formatted_stats)
 
+    if return_fig:
+        return fig
+
 
 # Function to visualize the relationship between a categorical feature and a numerical feature using boxplots and point plots
-def plot_boxplot_and_pointplot(data, cat_feature, num_feature, scale_factor=0.5):
+def plot_boxplot_and_pointplot(
+    data, cat_feature, num_feature, scale_factor=0.5, show=True, return_fig=False
+):
     """
     Visualize the relationship between a categorical feature and a numerical feature using boxplots and point plots.
 
@@ -374,12 +1054,14 @@ def plot_boxplot_and_pointplot(data, cat_feature, num_feature, scale_factor=0.5)
     - categorical_feature (str): The categorical feature to be plotted on the x-axis.
     - numerical_feature (str): The numerical feature to be plotted on the y-axis.
     - scale_factor (float): The scale factor for the point plot markers.
+    - show (bool): Whether to display the figure. Default is True.
+    - return_fig (bool): Whether to return the figure. Default is False.
 
     Returns:
-    - None: The function displays the plots and prints key statistics.
+    - Figure or None: The figure if return_fig is True, otherwise None. The function displays the plots if show is True.
     """
     # Initiate figure
-    plt.figure(figsize=(14, 8))
+    fig = plt.figure(figsize=(14, 8), layout="constrained")
 
     # Plot boxplot
     sns.boxplot(
@@ -415,8 +1097,14 @@ def plot_boxplot_and_pointplot(data, cat_feature, num_feature, scale_factor=0.5)
     )
     plt.grid(axis="y", linestyle="--", linewidth=0.5)
 
-    plt.tight_layout(pad=2.0)
-    plt.show()
+    # Display the figure, or close it if it is neither displayed nor returned
+    if show:
+        plt.show()
+    elif not return_fig:
+        plt.close(fig)
+
+    if return_fig:
+        return fig
 
 
 # ---------------------------------------------------------